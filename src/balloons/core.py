@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, make_dataclass
-from enum import Enum
+import math
+import os
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, fields, make_dataclass
+from enum import Enum, auto
+from functools import cache
 from pathlib import Path
 from types import NoneType, UnionType
 from typing import (
+    Any,
     ClassVar,
     Generic,
     Mapping,
@@ -20,6 +26,11 @@ from typing import (
 
 from typing_extensions import dataclass_transform
 
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 @dataclass(frozen=True)
 class Balloon:
@@ -65,13 +76,19 @@ class NamedBalloon(Balloon):
     """
 
     def __hash__(self) -> int:
-        return hash(f"{type(self).Base.__qualname__}:{self.name}")
+        # Both strings cache their hash, so no new string is built and hashed
+        return hash((type(self)._reference_prefix, self.name))
 
     Base: ClassVar[type[Balloon]]
     """
     The base type of the named balloon class.
     """
 
+    _reference_prefix: ClassVar[str]
+    """
+    The prefix of the references to named balloons of the class.
+    """
+
 
 @dataclass_transform(frozen_default=True)
 def balloon(cls: type[Balloon]) -> type[Balloon]:
@@ -96,6 +113,7 @@ def balloon(cls: type[Balloon]) -> type[Balloon]:
 
     cls.Named = named_cls
     named_cls.Base = cls
+    named_cls._reference_prefix = f"{cls.__qualname__}:"
 
     return cls
 
@@ -135,11 +153,180 @@ Value that can be dumped to JSON format.
 """
 
 
+# Typed as a plain callable, as mypy does not consider balloon classes Hashable when
+# checking them against the parameters of the cache wrapper
+_cached_type_hints: Callable[[type], dict[str, Any]] = cache(get_type_hints)
+"""
+Resolve the type hints of a class, caching them as classes are static.
+"""
+
+
+class _StaticTypeKind(Enum):
+    """
+    The kinds of static types of fields, each deflated and inflated differently.
+    """
+
+    DICT = auto()
+    TUPLE = auto()
+    SET = auto()
+    OPTIONAL = auto()
+    BALLOON = auto()
+    ENUM = auto()
+    BASIC = auto()
+
+
+@cache
+def _resolve_static_type(static_type: Any) -> tuple[_StaticTypeKind, tuple[Any, ...]]:
+    """
+    Classify the static type of a field for deflation and inflation, caching the
+    classification as static types are immutable.
+
+    :param static_type: The static type of the field.
+    :return: The kind of the static type and the type arguments relevant to it.
+    """
+    type_origin = get_origin(static_type)
+    type_args = get_args(static_type)
+
+    if type_origin is dict:
+        return _StaticTypeKind.DICT, type_args
+
+    if type_origin is tuple:
+        return _StaticTypeKind.TUPLE, type_args
+
+    if type_origin is set:
+        return _StaticTypeKind.SET, type_args
+
+    if type_origin is UnionType:
+        # NOTE: Arbitrary union types not implemented for now
+        # They would either require a try/except logic or inspecting the deflated
+        # field to determine the type
+        optional_type, none_type = type_args
+        assert none_type is NoneType
+        return _StaticTypeKind.OPTIONAL, (optional_type,)
+
+    if issubclass(static_type, Balloon):
+        return _StaticTypeKind.BALLOON, ()
+
+    if issubclass(static_type, Enum):
+        return _StaticTypeKind.ENUM, ()
+
+    if issubclass(static_type, BasicType):  # type: ignore[arg-type]
+        return _StaticTypeKind.BASIC, ()
+
+    raise ValueError(f"Unsupported type: {static_type}")
+
+
+def _dump_json(json_: Json) -> bytes:
+    """
+    Dump a value to indented JSON, using orjson if available.
+
+    :param json_: The value to dump.
+    :return: The JSON representation of the value, as bytes.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(json_, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits, non-finite floats and lone surrogates,
+            # which only the standard library supports
+            pass
+    return json.dumps(json_, indent=2).encode()
+
+
+class _IntegerPrecisionError(AssertionError):
+    """
+    Raised when an integer field was loaded from JSON as a float, as orjson does for
+    integers beyond 64 bits. Floats in the JSON itself fail like other type checks.
+    """
+
+
+def _load_json(content: bytes) -> Json:
+    """
+    Load a value from JSON, using orjson if available.
+
+    :param content: The JSON representation of the value, as bytes.
+    :return: The value.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # e.g. NaN and infinities written by older versions of the library
+            pass
+    return json.loads(content)
+
+
+def _scan_names(jsons_path: Path) -> set[str]:
+    """
+    Scan a directory of JSON representations of balloons, creating it if missing.
+
+    :param jsons_path: The path to the directory.
+    :return: The names of the balloons in the directory.
+    """
+    # Directories usually exist already, avoid a failing mkdir in that case
+    if not os.path.isdir(jsons_path):
+        jsons_path.mkdir(exist_ok=True)
+    with os.scandir(jsons_path) as entries:
+        return {e.name[:-5] for e in entries if e.name.endswith(".json")}
+
+
+_READ_CHUNK_SIZE = 1 << 16
+
+# Reads are IO bound, a few workers are enough to keep the disk busy
+_WARM_MAX_WORKERS = 8
+
+
+def _read_bytes(path: Path) -> bytes:
+    """
+    Read the content of a file, bypassing the buffered IO layers of Path.read_bytes.
+
+    :param path: The path to the file.
+    :return: The content of the file.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        content = os.read(fd, os.fstat(fd).st_size)
+        # Reads can be short, keep reading until the end of the file
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            content += chunk
+        return content
+    finally:
+        os.close(fd)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _deflate_enum(value: Enum) -> str:
+    return value.name
+
+
+class _NonFiniteFloat(float):
+    """
+    A NaN or infinity, which orjson would dump as null. orjson refuses to dump float
+    subclasses, so the standard library dumps these instead.
+    """
+
+
+def _deflate_float(value: float) -> float:
+    if isinstance(value, float) and not math.isfinite(value):
+        return _NonFiniteFloat(value)
+    return value
+
+
 class FieldDeflator:
     """
     Deflates balloon fields to their JSON representations.
     """
 
+    __slots__ = (
+        "_trackers",
+        "_field_deflators",
+        "_deflators",
+        "_balloon_deflators",
+    )
+
     def __init__(
         self,
         trackers: Mapping[type[Balloon], BalloonTracker[NamedBalloon]],
@@ -149,49 +336,173 @@ class FieldDeflator:
         """
         self._trackers = trackers
 
-    def deflate(self, value: Field) -> Json:
+        self._field_deflators: dict[
+            type[Balloon], dict[str, Callable[[Any], Json]]
+        ] = {}
+        self._deflators: dict[Any, Callable[[Any], Json]] = {}
+
+        # Runtime balloon types are resolved the first time they are seen
+        self._balloon_deflators: dict[type, Callable[[Any], Json]] = {}
+
+    def deflate(self, value: Balloon) -> Json:
         """
-        Deflate a field to its JSON representation.
+        Deflate a balloon field to its JSON representation, dispatching on its
+        runtime type as it can be named or anonymous and of any subtype.
 
-        :param value: The field to deflate.
-        :return: The JSON representation of the field.
+        :param value: The balloon to deflate.
+        :return: The JSON representation of the balloon.
         """
-        if isinstance(value, Balloon):
-            if isinstance(value, NamedBalloon):
-                named_type = value.__class__
-                tracker = self._trackers[named_type.Base]
-                tracker.track(value)
-                return f"{named_type.Base.__qualname__}:{value.name}"
-            else:
-                type_ = value.__class__
-                fields = {
-                    field_name: self.deflate(field)
-                    for field_name, field in value.__dict__.items()
-                }
-                return {
-                    "type": type_.__qualname__,
-                    "fields": fields,
-                }
-            raise ValueError(f"Unsupported balloon type: {type(value)}")
-
-        if isinstance(value, dict):
-            return {
-                self.deflate(key): self.deflate(value) for key, value in value.items()
-            }
+        type_ = type(value)
+        if (deflate := self._balloon_deflators.get(type_)) is None:
+            deflate = self._resolve_deflate(type_)
+            self._balloon_deflators[type_] = deflate
 
-        if isinstance(value, (set, tuple)):
-            return [self.deflate(item) for item in value]
+        return deflate(value)
 
-        if isinstance(value, Enum):
-            return f"{value.name}"
+    def deflate_fields(self, balloon: Balloon) -> dict[str, Json]:
+        """
+        Deflate the fields of a balloon to their JSON representations, excluding the
+        name of named balloons.
 
-        if isinstance(value, BasicType):  # type: ignore[arg-type,misc]
-            return value
+        :param balloon: The balloon whose fields to deflate.
+        :return: The JSON representations of the fields, indexed by field name.
+        """
+        field_deflators = self._get_field_deflators(type(balloon))
+        return {
+            field_name: deflate_field(getattr(balloon, field_name))
+            for field_name, deflate_field in field_deflators.items()
+        }
 
-        if value is None:
-            return None
+    def _get_field_deflators(
+        self, type_: type[Balloon]
+    ) -> dict[str, Callable[[Any], Json]]:
+        """
+        Provide the deflators of the fields of a balloon type, specialized once per
+        type on the static types of the fields.
+
+        :param type_: The balloon type.
+        :return: The field deflators, indexed by field name.
+        """
+        if (field_deflators := self._field_deflators.get(type_)) is not None:
+            return field_deflators
+
+        field_types = _cached_type_hints(type_)
+        field_deflators = {
+            field.name: self._get_deflator(field_types[field.name])
+            for field in fields(type_)
+            if not (issubclass(type_, NamedBalloon) and field.name == "name")
+        }
+        self._field_deflators[type_] = field_deflators
+        return field_deflators
+
+    def _resolve_deflate(self, type_: type) -> Callable[[Any], Json]:
+        """
+        Resolve how to deflate balloons of a runtime type.
+
+        :param type_: The runtime type of the balloons.
+        :return: The deflation function for the balloons.
+        """
+        if issubclass(type_, NamedBalloon):
+            return self._deflate_named
+
+        if issubclass(type_, Balloon):
+            return self._deflate_anonymous
+
+        raise ValueError(f"Unsupported type: {type_}")
+
+    def _get_deflator(self, static_type: Any) -> Callable[[Any], Json]:
+        """
+        Provide the deflator of fields of a static type, compiled once per type.
+
+        :param static_type: The static type of the fields.
+        :return: The deflator of the fields.
+        """
+        if (deflator := self._deflators.get(static_type)) is not None:
+            return deflator
+
+        deflator = self._compile_deflator(static_type)
+        self._deflators[static_type] = deflator
+        return deflator
 
-        raise ValueError(f"Unsupported type: {type(value)}")
+    def _compile_deflator(self, static_type: Any) -> Callable[[Any], Json]:
+        """
+        Compile a deflator specialized on a static type, binding the deflators of its
+        type arguments so that containers skip the dispatch on their items.
+
+        :param static_type: The static type of the fields.
+        :return: The deflator of the fields.
+        """
+        kind, type_args = _resolve_static_type(static_type)
+
+        match kind:
+            case _StaticTypeKind.DICT:
+                key_type, value_type = type_args
+                deflate_key = self._get_deflator(key_type)
+                deflate_value = self._get_deflator(value_type)
+
+                def deflate_dict(value: dict[Any, Field]) -> Json:
+                    return {
+                        deflate_key(key): deflate_value(item)
+                        for key, item in value.items()
+                    }
+
+                return deflate_dict
+
+            case _StaticTypeKind.TUPLE | _StaticTypeKind.SET:
+                (item_type,) = type_args
+                deflate_item = self._get_deflator(item_type)
+
+                def deflate_collection(value: set[Any] | tuple[Field, ...]) -> Json:
+                    return [deflate_item(item) for item in value]
+
+                return deflate_collection
+
+            case _StaticTypeKind.OPTIONAL:
+                (optional_type,) = type_args
+                deflate_optional = self._get_deflator(optional_type)
+
+                def deflate_optional_or_none(value: Field) -> Json:
+                    if value is None:
+                        return None
+                    return deflate_optional(value)
+
+                return deflate_optional_or_none
+
+            case _StaticTypeKind.BALLOON:
+                # Balloons can be named or anonymous, and of any subtype
+                return self.deflate
+
+            case _StaticTypeKind.ENUM:
+                return _deflate_enum
+
+            case _StaticTypeKind.BASIC:
+                if static_type is float:
+                    return _deflate_float
+                return _identity
+
+    def _deflate_named(self, value: NamedBalloon) -> str:
+        """
+        Track a named balloon and deflate it to a reference.
+
+        :param value: The named balloon to deflate.
+        :return: The reference to the named balloon.
+        """
+        named_type = value.__class__
+        tracker = self._trackers[named_type.Base]
+        tracker.track(value)
+        return named_type._reference_prefix + value.name
+
+    def _deflate_anonymous(self, value: Balloon) -> Json:
+        """
+        Deflate an anonymous balloon to its JSON representation.
+
+        :param value: The anonymous balloon to deflate.
+        :return: The JSON representation of the balloon.
+        """
+        return {
+            "type": value.__class__.__qualname__,
+            "fields": self.deflate_fields(value),
+        }
 
 
 class FieldInflator:
@@ -199,6 +510,14 @@ class FieldInflator:
     Inflates fields from their JSON representations.
     """
 
+    __slots__ = (
+        "_types",
+        "_providers",
+        "_field_inflators",
+        "_inflators",
+        "_monomorphic_types",
+    )
+
     def __init__(
         self,
         types_: dict[str, type[Balloon]],
@@ -211,6 +530,12 @@ class FieldInflator:
         self._types = types_
         self._providers = providers
 
+        self._field_inflators: dict[
+            type[Balloon], dict[str, Callable[[Json], Any]]
+        ] = {}
+        self._inflators: dict[Any, Callable[[Json], Any]] = {}
+        self._monomorphic_types: dict[type[Balloon], bool] = {}
+
     def inflate(self, json_: Json, static_type: type[F]) -> F:
         """
         Inflate a field from its JSON representation.
@@ -219,72 +544,194 @@ class FieldInflator:
         :param static_type: The static type of the field.
         :return: The inflated field.
         """
-        type_origin = get_origin(static_type)
-        type_args = get_args(static_type)
+        return self._get_inflator(static_type)(json_)
 
-        if type_origin is dict:
-            assert isinstance(json_, dict)
-            key_type, value_type = type_args
-            return {
-                self.inflate(key, key_type): self.inflate(value, value_type)
-                for key, value in json_.items()
-            }  # type: ignore[return-value]
-
-        if type_origin is tuple:
-            assert isinstance(json_, list)
-            (item_type,) = type_args
-            return tuple(self.inflate(item, item_type) for item in json_)  # type: ignore[return-value]
-
-        if type_origin is set:
-            assert isinstance(json_, list)
-            (item_type,) = type_args
-            return {self.inflate(item, item_type) for item in json_}  # type: ignore[return-value]
-
-        if type_origin is UnionType:
-            # NOTE: Arbitrary union types not implemented for now
-            # They would either require a try/except logic or inspecting the deflated
-            # field to determine the type
-            optional_type, none_type = type_args
-            assert none_type is NoneType
-
-            if json_ is None:
-                return None  # type: ignore[return-value]
-
-            return self.inflate(json_, optional_type)
-
-        if issubclass(static_type, Balloon):
-            if isinstance(json_, str):
-                # it is a named balloon
-                type_name, _, name = json_.partition(":")
-                type_ = self._types[type_name]
-                assert issubclass(type_, static_type)
-                provider = self._providers[type_]
-                return provider.get(name)  # type: ignore[return-value]
-            if isinstance(json_, dict):
-                type_name = json_["type"]
-                type_ = self._types[type_name]
-                assert issubclass(type_, static_type)
-                fields = json_["fields"]
-                field_types = get_type_hints(type_)
-                fields = {
-                    field_name: self.inflate(
-                        field_json,
-                        field_types[field_name],
-                    )
-                    for field_name, field_json in fields.items()
-                }
-                return type_(**fields)  # type: ignore[return-value]
-            raise ValueError(f"Unsupported balloon json: {json_}")
+    def inflate_fields(
+        self, json_: dict[str, Json], type_: type[Balloon]
+    ) -> dict[str, Any]:
+        """
+        Inflate the fields of a balloon from their JSON representations.
 
-        if issubclass(static_type, Enum):
-            assert isinstance(json_, str)
-            return static_type[json_]  # type: ignore[return-value]
+        :param json_: The JSON representations of the fields, indexed by field name.
+        :param type_: The balloon type.
+        :return: The inflated fields, indexed by field name.
+        """
+        field_inflators = self._get_field_inflators(type_)
+        return {
+            field_name: field_inflators[field_name](field_json)
+            for field_name, field_json in json_.items()
+        }
+
+    def _resolve_balloon_type(
+        self, type_name: str, static_type: type[Balloon]
+    ) -> type[Balloon]:
+        """
+        Resolve the type of a balloon from its name, skipping the lookup when the
+        static type has no subtypes to choose from and the name is its own.
+
+        :param type_name: The name of the balloon type.
+        :param static_type: The static type of the field.
+        :return: The balloon type.
+        """
+        if (monomorphic := self._monomorphic_types.get(static_type)) is None:
+            monomorphic = all(
+                t is static_type or not issubclass(t, static_type)
+                for t in self._types.values()
+            )
+            self._monomorphic_types[static_type] = monomorphic
+
+        if monomorphic and type_name == static_type.__qualname__:
+            return static_type
+
+        type_ = self._types[type_name]
+        assert issubclass(type_, static_type)
+        return type_
+
+    def _get_field_inflators(
+        self, type_: type[Balloon]
+    ) -> dict[str, Callable[[Json], Any]]:
+        """
+        Provide the inflators of the fields of a balloon type, specialized once per
+        type on the static types of the fields.
+
+        :param type_: The balloon type.
+        :return: The field inflators, indexed by field name.
+        """
+        if (field_inflators := self._field_inflators.get(type_)) is not None:
+            return field_inflators
+
+        field_types = _cached_type_hints(type_)
+        field_inflators = {
+            field.name: self._get_inflator(field_types[field.name])
+            for field in fields(type_)
+        }
+        self._field_inflators[type_] = field_inflators
+        return field_inflators
+
+    def _get_inflator(self, static_type: Any) -> Callable[[Json], Any]:
+        """
+        Provide the inflator of fields of a static type, compiled once per type.
+
+        :param static_type: The static type of the fields.
+        :return: The inflator of the fields.
+        """
+        if (inflator := self._inflators.get(static_type)) is not None:
+            return inflator
+
+        inflator = self._compile_inflator(static_type)
+        self._inflators[static_type] = inflator
+        return inflator
+
+    def _compile_inflator(self, static_type: Any) -> Callable[[Json], Any]:
+        """
+        Compile an inflator specialized on a static type, binding the inflators of
+        its type arguments so that no type introspection happens while inflating.
+
+        :param static_type: The static type of the fields.
+        :return: The inflator of the fields.
+        """
+        kind, type_args = _resolve_static_type(static_type)
+
+        match kind:
+            case _StaticTypeKind.DICT:
+                key_type, value_type = type_args
+                inflate_key = self._get_inflator(key_type)
+                inflate_value = self._get_inflator(value_type)
+
+                def inflate_dict(json_: Json) -> Any:
+                    assert isinstance(json_, dict)
+                    return {
+                        inflate_key(key): inflate_value(value)
+                        for key, value in json_.items()
+                    }
 
-        if issubclass(static_type, BasicType):  # type: ignore[arg-type,misc]
-            assert isinstance(json_, static_type)
-            return json_  # type: ignore[return-value]
+                return inflate_dict
 
-        raise ValueError(f"Unsupported type: {static_type}")
+            case _StaticTypeKind.TUPLE:
+                (item_type,) = type_args
+                inflate_item = self._get_inflator(item_type)
+
+                def inflate_tuple(json_: Json) -> Any:
+                    assert isinstance(json_, list)
+                    # A list is faster to build than a generator to consume
+                    return tuple([inflate_item(item) for item in json_])
+
+                return inflate_tuple
+
+            case _StaticTypeKind.SET:
+                (item_type,) = type_args
+                inflate_item = self._get_inflator(item_type)
+
+                def inflate_set(json_: Json) -> Any:
+                    assert isinstance(json_, list)
+                    return {inflate_item(item) for item in json_}
+
+                return inflate_set
+
+            case _StaticTypeKind.OPTIONAL:
+                (optional_type,) = type_args
+                inflate_optional = self._get_inflator(optional_type)
+
+                def inflate_optional_or_none(json_: Json) -> Any:
+                    if json_ is None:
+                        return None
+                    return inflate_optional(json_)
+
+                return inflate_optional_or_none
+
+            case _StaticTypeKind.BALLOON:
+                # Named balloons are referenced over and over, resolve each reference
+                # only once
+                references: dict[str, tuple[BalloonProvider[NamedBalloon], str]] = {}
+
+                resolve_balloon_type = self._resolve_balloon_type
+                inflate_fields = self.inflate_fields
+                providers = self._providers
+
+                # Fields of balloons are inflated through the field plans of the
+                # dynamic type, which also keeps recursive balloon types finite
+                def inflate_balloon(json_: Json) -> Any:
+                    if isinstance(json_, str):
+                        # it is a named balloon
+                        if (reference := references.get(json_)) is None:
+                            type_name, _, name = json_.partition(":")
+                            type_ = resolve_balloon_type(type_name, static_type)
+                            reference = (providers[type_], name)
+                            references[json_] = reference
+                        provider, name = reference
+                        return provider.get(name)
+                    if isinstance(json_, dict):
+                        type_ = resolve_balloon_type(json_["type"], static_type)
+                        fields_ = inflate_fields(json_["fields"], type_)
+                        return type_(**fields_)
+                    raise ValueError(f"Unsupported balloon json: {json_}")
+
+                return inflate_balloon
+
+            case _StaticTypeKind.ENUM:
+
+                def inflate_enum(json_: Json) -> Any:
+                    assert isinstance(json_, str)
+                    return static_type[json_]
+
+                return inflate_enum
+
+            case _StaticTypeKind.BASIC:
+                if static_type is int:
+
+                    def inflate_int(json_: Json) -> Any:
+                        if type(json_) is float:
+                            raise _IntegerPrecisionError
+                        assert isinstance(json_, int)
+                        return json_
+
+                    return inflate_int
+
+                def inflate_basic(json_: Json) -> Any:
+                    assert isinstance(json_, static_type)
+                    return json_
+
+                return inflate_basic
 
 
 # NOTE: Ignoring mypy misc below as it otherwise complains that NM must be covariant
@@ -295,6 +742,8 @@ class BalloonProvider(Protocol[BLN]):  # type: ignore[misc]
     Provides named balloons of a balloon type, not including subtypes.
     """
 
+    __slots__ = ()
+
     def get(self, name: str) -> BLN:
         """
         Provide a named balloon.
@@ -309,6 +758,8 @@ class BalloonTracker(Protocol[BLN]):  # type: ignore[misc]
     Tracks named balloons of a balloon type, not including subtypes.
     """
 
+    __slots__ = ()
+
     def track(self, balloon: BLN) -> None:
         """
         Track a named balloon.
@@ -322,6 +773,15 @@ class BalloonSpecialist(BalloonProvider[BLN], BalloonTracker[BLN]):
     Manages named balloons of a balloon type, not including subtypes.
     """
 
+    __slots__ = (
+        "_type",
+        "_names",
+        "_deflator",
+        "_inflator",
+        "_jsons_path",
+        "_balloons",
+    )
+
     def __init__(
         self,
         type_: type[BLN],
@@ -347,27 +807,14 @@ class BalloonSpecialist(BalloonProvider[BLN], BalloonTracker[BLN]):
         self._balloons: dict[str, NamedBalloon] = {}
 
     def get(self, name: str) -> BLN:
-        if name not in self._names:
-            raise ValueError(f"Could not find balloon with name: {name}")
-
+        # Inflated balloons are always among the names, so check them first
         if (value := self._balloons.get(name)) is not None:
             return value  # type: ignore[return-value]
 
-        json_path = self._jsons_path / f"{name}.json"
-        json_ = json.loads(json_path.read_text())
-
-        field_types = get_type_hints(self._type)
-        init_kwargs = {"name": name} | {
-            field_name: self._inflator.inflate(
-                json_=deflated_field,
-                static_type=field_types[field_name],
-            )
-            for field_name, deflated_field in json_.items()
-        }
+        if name not in self._names:
+            raise ValueError(f"Could not find balloon with name: {name}")
 
-        balloon = self._type(**init_kwargs)
-        self._balloons[name] = balloon
-        return balloon
+        return self._inflate(name, self._read(name))
 
     def track(self, balloon: BLN) -> None:
         if type(balloon) is not self._type:
@@ -384,15 +831,10 @@ class BalloonSpecialist(BalloonProvider[BLN], BalloonTracker[BLN]):
             self._balloons[balloon.name] = balloon
             return
 
-        fields = {n: v for n, v in balloon.__dict__.items()}
-        fields.pop("name")
-        json_ = {
-            field_name: self._deflator.deflate(field)
-            for field_name, field in fields.items()
-        }
+        json_ = self._deflator.deflate_fields(balloon)
 
         json_path = self._jsons_path / f"{balloon.name}.json"
-        json_path.write_text(json.dumps(json_, indent=2))
+        json_path.write_bytes(_dump_json(json_))
 
         self._names.add(balloon.name)
         self._balloons[balloon.name] = balloon
@@ -405,12 +847,72 @@ class BalloonSpecialist(BalloonProvider[BLN], BalloonTracker[BLN]):
         """
         return self._names
 
+    def warm(self, names: Iterable[str], executor: Executor) -> None:
+        """
+        Inflate balloons ahead of their retrieval, reading their JSON representations
+        concurrently.
+
+        :param names: The names of the balloons.
+        :param executor: The executor reading the JSON representations.
+        """
+        names = [name for name in names if name not in self._balloons]
+        for name in names:
+            if name not in self._names:
+                raise ValueError(f"Could not find balloon with name: {name}")
+
+        for name, content in zip(names, executor.map(self._read, names), strict=True):
+            # The balloon might have been inflated as a field of a previous one
+            if name not in self._balloons:
+                self._inflate(name, content)
+
+    def _read(self, name: str) -> bytes:
+        """
+        Read the JSON representation of a balloon.
+
+        :param name: The name of the balloon.
+        :return: The JSON representation of the balloon, as bytes.
+        """
+        return _read_bytes(self._jsons_path / f"{name}.json")
+
+    def _inflate(self, name: str, content: bytes) -> BLN:
+        """
+        Inflate a balloon from its JSON representation and keep track of it.
+
+        :param name: The name of the balloon.
+        :param content: The JSON representation of the balloon, as bytes.
+        :return: The balloon.
+        """
+        json_ = _load_json(content)
+        assert isinstance(json_, dict)
+
+        try:
+            fields_ = self._inflator.inflate_fields(json_=json_, type_=self._type)
+        except _IntegerPrecisionError:
+            # The standard library keeps the precision of integers beyond 64 bits
+            json_ = json.loads(content)
+            assert isinstance(json_, dict)
+            fields_ = self._inflator.inflate_fields(json_=json_, type_=self._type)
+
+        init_kwargs = {"name": name} | fields_
+
+        balloon = self._type(**init_kwargs)
+        self._balloons[name] = balloon
+        return balloon
+
 
 class NamespaceManager:
     """
     Efficiently manages the namespace of balloon types.
     """
 
+    __slots__ = (
+        "_top_namespace_types",
+        "_name_to_types",
+        "_supported_namespace_types",
+        "_resolved_types",
+        "_relevant_namespace_types",
+    )
+
     def __init__(
         self,
         top_namespace_types: set[type[Balloon]],
@@ -420,7 +922,13 @@ class NamespaceManager:
             respective namespaces.
         """
         self._top_namespace_types = top_namespace_types
-        self._name_to_types: dict[str, set[type[Balloon]]] = {}
+        # Names are rarely shared across namespaces, so tuples are cheaper than sets
+        self._name_to_types: dict[str, tuple[type[Balloon], ...]] = {}
+
+        # Type relations are static, so checks on them are computed only once
+        self._supported_namespace_types: dict[type[Balloon], bool] = {}
+        self._resolved_types: dict[str, dict[type[Balloon], type[Balloon]]] = {}
+        self._relevant_namespace_types: dict[type[Balloon], set[type[Balloon]]] = {}
 
     def get(self, name: str, namespace_type: type[BL]) -> type[BL] | None:
         """
@@ -430,12 +938,24 @@ class NamespaceManager:
         :param namespace_type: The namespace type to use to find the balloon type.
         :return: The type of the balloon, if any.
         """
-        if all(not issubclass(namespace_type, t) for t in self._top_namespace_types):
+        if (supported := self._supported_namespace_types.get(namespace_type)) is None:
+            supported = any(
+                issubclass(namespace_type, t) for t in self._top_namespace_types
+            )
+            self._supported_namespace_types[namespace_type] = supported
+
+        if not supported:
             raise ValueError(f"Unsupported namespace type: {namespace_type}")
 
-        types_ = self._name_to_types.get(name, set())
+        resolved_types = self._resolved_types.get(name)
+        if resolved_types is not None and namespace_type in resolved_types:
+            return resolved_types[namespace_type]  # type: ignore[return-value]
 
-        candidate_types = {t for t in types_ if issubclass(t, namespace_type)}
+        # Avoid allocating an empty set for names that were never tracked
+        if not (types_ := self._name_to_types.get(name)):
+            return None
+
+        candidate_types = [t for t in types_ if issubclass(t, namespace_type)]
 
         if len(candidate_types) == 0:
             return None
@@ -443,7 +963,8 @@ class NamespaceManager:
         if len(candidate_types) > 1:
             raise ValueError(f"Found multiple balloons with name: {name}")
 
-        type_ = candidate_types.pop()
+        (type_,) = candidate_types
+        self._resolved_types.setdefault(name, {})[namespace_type] = type_
         return type_
 
     def track(self, name: str, type_: type[Balloon]) -> None:
@@ -453,16 +974,20 @@ class NamespaceManager:
         :param name: The balloon name.
         :param type_: The balloon type.
         """
-        if name not in self._name_to_types:
-            self._name_to_types[name] = set()
+        tracked_types = self._name_to_types.get(name, ())
 
-        if type_ in self._name_to_types[name]:
+        if type_ in tracked_types:
             return
 
-        relevant_namespace_types = {
-            t for t in self._top_namespace_types if issubclass(type_, t)
-        }
-        for tracked_type in self._name_to_types[name]:
+        if (
+            relevant_namespace_types := self._relevant_namespace_types.get(type_)
+        ) is None:
+            relevant_namespace_types = {
+                t for t in self._top_namespace_types if issubclass(type_, t)
+            }
+            self._relevant_namespace_types[type_] = relevant_namespace_types
+
+        for tracked_type in tracked_types:
             for namespace_type in relevant_namespace_types:
                 if issubclass(tracked_type, namespace_type):
                     raise ValueError(
@@ -473,7 +998,24 @@ class NamespaceManager:
                         f"New type: {type_}"
                     )
 
-        self._name_to_types[name].add(type_)
+        self._name_to_types[name] = (*tracked_types, type_)
+        # The name now resolves to a new type in some namespaces
+        self._resolved_types.pop(name, None)
+
+    def track_all(self, names: Iterable[str], type_: type[Balloon]) -> None:
+        """
+        Track balloons of the same type by name.
+
+        :param names: The balloon names.
+        :param type_: The balloon type.
+        """
+        name_to_types = self._name_to_types
+        for name in names:
+            # Names not tracked yet cannot conflict, nor have resolved types
+            if name not in name_to_types:
+                name_to_types[name] = (type_,)
+            else:
+                self.track(name, type_)
 
 
 class Balloonist(Generic[BL]):
@@ -481,6 +1023,12 @@ class Balloonist(Generic[BL]):
     Manages named balloons of a balloon type, including subtypes.
     """
 
+    __slots__ = (
+        "_type",
+        "_namespace_manager",
+        "_balloon_specialists",
+    )
+
     def __init__(
         self,
         type_: type[BL],
@@ -538,10 +1086,27 @@ class Balloonist(Generic[BL]):
 
         :return: The names of the managed balloons.
         """
-        names = set()
-        for balloon_specialist in self._balloon_specialists.values():
-            names.update(balloon_specialist.get_names())
-        return names
+        return set().union(
+            *(bs.get_names() for bs in self._balloon_specialists.values())
+        )
+
+    def warm(self, names: Iterable[str]) -> None:
+        """
+        Inflate balloons ahead of their retrieval, reading their JSON representations
+        from the JSON database concurrently.
+
+        :param names: The balloon names.
+        """
+        names_by_type: dict[type[Balloon], list[str]] = {}
+        for name in names:
+            type_: type[Balloon] | None = self._namespace_manager.get(name, self._type)
+            if type_ is None:
+                raise ValueError(f"Could not find balloon with name: {name}")
+            names_by_type.setdefault(type_, []).append(name)
+
+        with ThreadPoolExecutor(max_workers=_WARM_MAX_WORKERS) as executor:
+            for type_, type_names in names_by_type.items():
+                self._balloon_specialists[type_].warm(type_names, executor)
 
 
 class BalloonistFactory(Generic[BL]):
@@ -549,6 +1114,13 @@ class BalloonistFactory(Generic[BL]):
     Factory for balloonists.
     """
 
+    __slots__ = (
+        "_namespace_types",
+        "_balloon_specialists",
+        "_namespace_manager",
+        "_balloon_specialists_by_type",
+    )
+
     def __init__(
         self,
         namespace_types: set[type[Balloon]],
@@ -564,6 +1136,11 @@ class BalloonistFactory(Generic[BL]):
         self._balloon_specialists = balloon_specialists
         self._namespace_manager = namespace_manager
 
+        # Type relations are static, so specialists are selected only once per type
+        self._balloon_specialists_by_type: dict[
+            type[Balloon], dict[type[Balloon], BalloonSpecialist[NamedBalloon]]
+        ] = {}
+
     def instantiate(self, type_: type[BL]) -> Balloonist[BL]:
         """
         Instantiate a balloonist for a balloon type
@@ -571,12 +1148,18 @@ class BalloonistFactory(Generic[BL]):
         :param type_: A balloon type.
         :return: The balloonist for the balloon type.
         """
-        if all(not issubclass(type_, t) for t in self._namespace_types):
-            raise ValueError(f"Unsupported balloonist balloon type: {type_}")
-
-        balloon_specialists: dict[type[Balloon], BalloonSpecialist[NamedBalloon]] = {
-            t: bs for t, bs in self._balloon_specialists.items() if issubclass(t, type_)
-        }
+        if (
+            balloon_specialists := self._balloon_specialists_by_type.get(type_)
+        ) is None:
+            if all(not issubclass(type_, t) for t in self._namespace_types):
+                raise ValueError(f"Unsupported balloonist balloon type: {type_}")
+
+            balloon_specialists = {
+                t: bs
+                for t, bs in self._balloon_specialists.items()
+                if issubclass(t, type_)
+            }
+            self._balloon_specialists_by_type[type_] = balloon_specialists
 
         return Balloonist(
             type_=type_,
@@ -589,6 +1172,7 @@ class BalloonistFactory(Generic[BL]):
         top_namespace_types: set[type[Balloon]],
         types_: set[type[Balloon]],
         json_database_path: Path,
+        warm: bool = False,
     ) -> BalloonistFactory:
         """
         Create a factory for balloonists.
@@ -597,6 +1181,8 @@ class BalloonistFactory(Generic[BL]):
             respective namespaces.
         :param types_: The balloon types.
         :param json_database_path: The path to the JSON database.
+        :param warm: Whether to inflate all the balloons in the JSON database upfront,
+            reading their JSON representations concurrently.
         :return: The factory for balloonists.
         """
         balloon_specialists: dict[type[Balloon], BalloonSpecialist[NamedBalloon]] = {}
@@ -608,12 +1194,15 @@ class BalloonistFactory(Generic[BL]):
             types_={t.__qualname__: t for t in types_},
             providers=balloon_specialists,
         )
+        namespace_manager = NamespaceManager(top_namespace_types=top_namespace_types)
         for type_ in types_:
+            # Pay the cost of resolving type hints upfront rather than on first use
+            _cached_type_hints(type_)
             if not any(issubclass(type_, t) for t in top_namespace_types):
                 continue
+            _cached_type_hints(type_.Named)
             jsons_path = json_database_path / type_.__qualname__
-            jsons_path.mkdir(exist_ok=True)
-            names = {p.stem for p in jsons_path.iterdir()}
+            names = _scan_names(jsons_path)
             balloon_specialists[type_] = BalloonSpecialist(
                 type_=type_.Named,
                 names=names,
@@ -621,11 +1210,12 @@ class BalloonistFactory(Generic[BL]):
                 deflator=field_deflator,
                 jsons_path=jsons_path,
             )
+            namespace_manager.track_all(names, type_)
 
-        namespace_manager = NamespaceManager(top_namespace_types=top_namespace_types)
-        for type_, balloon_specialist in balloon_specialists.items():
-            for name in balloon_specialist.get_names():
-                namespace_manager.track(name, type_)
+        if warm:
+            with ThreadPoolExecutor(max_workers=_WARM_MAX_WORKERS) as executor:
+                for balloon_specialist in balloon_specialists.values():
+                    balloon_specialist.warm(balloon_specialist.get_names(), executor)
 
         return BalloonistFactory(
             namespace_types=top_namespace_types,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
+import pytest
+
 from balloons import BalloonistFactory
 from tests.basic.objects import (
     ABIGAIL,
@@ -100,3 +103,90 @@ def test_consistency(tmp_path: Path) -> None:
     assert alice == ALICE
     assert bob == BOB
     assert carol == CAROL
+
+
+def test_warm(tmp_path: Path) -> None:
+    shutil.copytree(JSON_DATABASE_PATH, tmp_path, dirs_exist_ok=True)
+    balloonist_factory = get_balloonist_factory(tmp_path)
+    animal_balloonist = balloonist_factory.instantiate(Animal)
+    owner_balloonist = balloonist_factory.instantiate(Owner)
+
+    animal_balloonist.warm(animal_balloonist.get_names())
+    owner_balloonist.warm(owner_balloonist.get_names())
+
+    # Warmed balloons no longer need their JSON files
+    for json_path in tmp_path.glob("*/*.json"):
+        json_path.unlink()
+
+    # Owners
+    alice = owner_balloonist.get(ALICE.as_named().name)
+    bob = owner_balloonist.get(BOB.as_named().name)
+    carol = owner_balloonist.get(CAROL.as_named().name)
+    assert alice == ALICE
+    assert bob == BOB
+    assert carol == CAROL
+    # Pets are the same objects referenced by owners
+    abigail = animal_balloonist.get(ABIGAIL.as_named().name)
+    cody = animal_balloonist.get(CODY.as_named().name)
+    assert any(pet is abigail for pet in alice.pet_nicknames)
+    assert any(pet is cody for pet in carol.pet_nicknames)
+
+    with pytest.raises(ValueError, match="Could not find balloon"):
+        animal_balloonist.warm(["nobody"])
+
+
+def test_type_validation(tmp_path: Path) -> None:
+    jsons_path = tmp_path / "Cat"
+    jsons_path.mkdir()
+    # The size of an animal can only be an animal size
+    (jsons_path / "abigail.json").write_text(
+        "{\n"
+        '  "size": {"type": "Owner", "fields": {"height": 10, "weight": 5}},\n'
+        '  "purr_type": "loud"\n'
+        "}"
+    )
+
+    balloonist_factory = get_balloonist_factory(tmp_path)
+    animal_balloonist = balloonist_factory.instantiate(Animal)
+    with pytest.raises(AssertionError):
+        animal_balloonist.get(ABIGAIL.as_named().name)
+
+
+def test_namespaces(tmp_path: Path) -> None:
+    balloonist_factory = get_balloonist_factory(tmp_path)
+    animal_balloonist = balloonist_factory.instantiate(Animal)
+    cat_balloonist = balloonist_factory.instantiate(Cat)
+    owner_balloonist = balloonist_factory.instantiate(Owner)
+
+    animal_balloonist.track(ABIGAIL)
+    assert animal_balloonist.get(ABIGAIL.as_named().name) is ABIGAIL
+    assert cat_balloonist.get(ABIGAIL.as_named().name) is ABIGAIL
+    with pytest.raises(ValueError, match="Could not find balloon"):
+        owner_balloonist.get(ABIGAIL.as_named().name)
+
+    # The same name in another namespace refers to another balloon
+    abigail_owner = Owner(pet_nicknames={}).to_named(ABIGAIL.as_named().name)
+    owner_balloonist.track(abigail_owner)
+    assert owner_balloonist.get(ABIGAIL.as_named().name) is abigail_owner
+    assert animal_balloonist.get(ABIGAIL.as_named().name) is ABIGAIL
+    assert cat_balloonist.get(ABIGAIL.as_named().name) is ABIGAIL
+
+    # The names are resolved the same way in a new Python session
+    other_balloonist_factory = get_balloonist_factory(tmp_path)
+    other_animal_balloonist = other_balloonist_factory.instantiate(Animal)
+    other_owner_balloonist = other_balloonist_factory.instantiate(Owner)
+    assert other_animal_balloonist.get(ABIGAIL.as_named().name) == ABIGAIL
+    assert other_owner_balloonist.get(ABIGAIL.as_named().name) == abigail_owner
+
+
+def test_name_conflict(tmp_path: Path) -> None:
+    # Cats and dogs share the animal namespace, so they cannot share names
+    for type_name in ("Cat", "Dog"):
+        jsons_path = tmp_path / type_name
+        jsons_path.mkdir()
+        (jsons_path / "abigail.json").write_text("{}")
+
+    with pytest.raises(
+        ValueError, match="Found balloon with same name in same namespace"
+    ):
+        get_balloonist_factory(tmp_path)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 from balloons import BalloonistFactory
@@ -87,3 +88,27 @@ def test_consistency(tmp_path: Path) -> None:
     assert fruit_salad == FRUIT_SALAD
     assert vegetable_salad == VEGETABLE_SALAD
     assert fruit_and_vegetable_salad == FRUIT_AND_VEGETABLE_SALAD
+
+
+def test_warm_on_create(tmp_path: Path) -> None:
+    shutil.copytree(JSON_DATABASE_PATH, tmp_path, dirs_exist_ok=True)
+    balloonist_factory = BalloonistFactory.create(
+        top_namespace_types={Food},
+        types_={Food, SimpleFood, CompositeFood},
+        json_database_path=tmp_path,
+        warm=True,
+    )
+    balloonist = balloonist_factory.instantiate(Food)
+
+    # Warmed balloons no longer need their JSON files
+    for json_path in tmp_path.glob("*/*.json"):
+        json_path.unlink()
+
+    fruit_and_vegetable_salad = balloonist.get(
+        FRUIT_AND_VEGETABLE_SALAD.as_named().name
+    )
+    fruit_salad = balloonist.get(FRUIT_SALAD.as_named().name)
+    apple = balloonist.get(APPLE.as_named().name)
+    assert fruit_and_vegetable_salad == FRUIT_AND_VEGETABLE_SALAD
+    assert any(food is fruit_salad for food in fruit_and_vegetable_salad.ingredients)
+    assert any(food is apple for food in fruit_salad.ingredients)
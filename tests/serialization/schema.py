@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from balloons import Balloon, balloon
+
+
+@balloon
+class Measurement(Balloon):
+    value: float
+    count: int
+    label: str
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import math
+from pathlib import Path
+
+import pytest
+
+from balloons import BalloonistFactory, core
+from tests.serialization.schema import Measurement
+
+# Larger than what fits in 64 bits
+LARGE_COUNT = 2**70
+
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(core, "orjson", None)
+    elif core.orjson is None:
+        pytest.skip("orjson is not installed")
+    return request.param
+
+
+def get_balloonist_factory(json_database_path: Path) -> BalloonistFactory:
+    return BalloonistFactory.create(
+        top_namespace_types={Measurement},
+        types_={Measurement},
+        json_database_path=json_database_path,
+    )
+
+
+def test_consistency(tmp_path: Path, json_backend: str) -> None:
+    measurement = Measurement(
+        value=0.5, count=LARGE_COUNT, label="température"
+    ).to_named("measurement")
+
+    balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    balloonist.track(measurement)
+
+    other_balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    assert other_balloonist.get("measurement") == measurement
+
+
+@pytest.mark.parametrize("value", [math.nan, math.inf, -math.inf])
+def test_non_finite_float(tmp_path: Path, json_backend: str, value: float) -> None:
+    measurement = Measurement(value=value, count=3, label="label").to_named(
+        "measurement"
+    )
+
+    balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    balloonist.track(measurement)
+
+    other_balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    other_measurement = other_balloonist.get("measurement")
+    # NaN is not equal to itself, so the floats are compared by representation
+    assert repr(other_measurement.value) == repr(value)
+    assert other_measurement.count == measurement.count
+
+
+def test_non_finite_float_on_disk(tmp_path: Path, json_backend: str) -> None:
+    # The standard library writes non-finite floats as non-standard JSON
+    jsons_path = tmp_path / "Measurement"
+    jsons_path.mkdir()
+    (jsons_path / "measurement.json").write_text(
+        '{\n  "value": NaN,\n  "count": 3,\n  "label": "label"\n}'
+    )
+
+    balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    measurement = balloonist.get("measurement")
+    assert math.isnan(measurement.value)
+
+
+def test_lone_surrogate(tmp_path: Path, json_backend: str) -> None:
+    measurement = Measurement(value=0.5, count=3, label="a\udc80b").to_named(
+        "measurement"
+    )
+
+    balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    balloonist.track(measurement)
+
+    other_balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    assert other_balloonist.get("measurement") == measurement
+
+
+def test_float_count_on_disk(tmp_path: Path, json_backend: str) -> None:
+    jsons_path = tmp_path / "Measurement"
+    jsons_path.mkdir()
+    (jsons_path / "measurement.json").write_text(
+        '{\n  "value": 0.5,\n  "count": 3.0,\n  "label": "label"\n}'
+    )
+
+    balloonist = get_balloonist_factory(tmp_path).instantiate(Measurement)
+    with pytest.raises(AssertionError):
+        balloonist.get("measurement")